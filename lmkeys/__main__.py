@@ -5,7 +5,6 @@ import sys
 from pathlib import Path
 
 from . import __version__
-from .viewer import run_viewer
 
 
 def main() -> None:
@@ -43,6 +42,9 @@ def main() -> None:
         print(f"Error: Path '{args.db_path}' is not a directory", file=sys.stderr)
         sys.exit(1)
 
+    # Imported here so --help and --version do not load lmdb and textual
+    from .viewer import run_viewer
+
     # Run the viewer
     try:
         run_viewer(str(db_path), args.page_size)
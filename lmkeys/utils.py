@@ -1,12 +1,25 @@
 """Utility functions for LMDB key/value processing"""
 
+from functools import lru_cache
 from typing import Tuple, Optional
 
 
+# Number of leading value bytes inspected by get_value_type
+VALUE_SNIFF_SIZE = 64
+
+# Bytes allowed in ASCII text: printable characters plus tab, LF and CR
+_TEXT_BYTES = bytes(range(0x20, 0x7f)) + b'\t\n\r'
+
+# Number of formatted keys remembered by format_key
+KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def format_key(key: bytes) -> str:
     """
     Format a key for display.
     Try to decode as UTF-8, otherwise display as hex.
+    Results are cached, so the key must be hashable bytes.
 
     Args:
         key: Raw key bytes from LMDB
@@ -14,10 +27,13 @@ def format_key(key: bytes) -> str:
     Returns:
         Formatted string representation
     """
+    # Most keys are plain ASCII: check that in C and skip the exception path
+    if key.isascii():
+        return key.decode('ascii')
     try:
         return key.decode('utf-8')
     except UnicodeDecodeError:
-        return f"0x{key.hex()}"
+        return '0x' + key.hex()
 
 
 def get_value_type(value: bytes) -> str:
@@ -25,7 +41,7 @@ def get_value_type(value: bytes) -> str:
     Determine the type of a value for display.
 
     Args:
-        value: Raw value bytes from LMDB
+        value: Raw value bytes (or a memoryview over them) from LMDB
 
     Returns:
         String describing the type (e.g., 'str', 'bytes', 'int')
@@ -33,22 +49,33 @@ def get_value_type(value: bytes) -> str:
     if value is None:
         return "None"
 
-    # Try to decode as UTF-8 string
-    try:
-        decoded = value.decode('utf-8')
-        # Check if it's printable
-        if decoded.isprintable() or all(c in '\n\r\t' for c in decoded if not c.isprintable()):
+    # Only the leading bytes are inspected, so large values cost the same
+    head = bytes(value[:VALUE_SNIFF_SIZE])
+
+    if head.isascii():
+        # Delete every text byte in one C pass; anything left is a control byte
+        if not head.translate(None, _TEXT_BYTES):
+            return "str"
+    else:
+        # Try to decode as UTF-8 string
+        try:
+            decoded = head.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # The sample may end in the middle of a multi-byte character
+            if len(value) > VALUE_SNIFF_SIZE and e.reason == 'unexpected end of data':
+                decoded = head[:e.start].decode('utf-8')
+            else:
+                decoded = None
+
+        # Check if it's printable, allowing tabs and line breaks
+        if decoded is not None and (
+            decoded.replace('\t', '').replace('\n', '').replace('\r', '').isprintable()
+        ):
             return "str"
-    except UnicodeDecodeError:
-        pass
 
-    # Try to interpret as integer
+    # Sizes of fixed-width integers
     if len(value) in (1, 2, 4, 8):
-        try:
-            # Check if it looks like a little-endian integer
-            return "int/bytes"
-        except Exception:
-            pass
+        return "int/bytes"
 
     # Default to bytes
     return "bytes"
@@ -59,7 +86,7 @@ def format_value_info(value: bytes) -> str:
     Format value information for display.
 
     Args:
-        value: Raw value bytes from LMDB
+        value: Raw value bytes (or a memoryview over them) from LMDB
 
     Returns:
         Formatted string with type and size info
@@ -67,3 +94,19 @@ def format_value_info(value: bytes) -> str:
     value_type = get_value_type(value)
     size = len(value)
     return f"{value_type} ({size} bytes)"
+
+
+def make_row(index: str, key: bytes, value: bytes) -> Tuple[str, str, str]:
+    """
+    Build a table row for a key/value pair in a single call.
+
+    Args:
+        index: Label for the 1-based position of the key in the database
+        key: Raw key bytes from LMDB
+        value: Raw value bytes (or a memoryview over them) from LMDB
+
+    Returns:
+        Tuple of (index, formatted key, value info)
+    """
+    key_str = key.decode('ascii') if key.isascii() else format_key(key)
+    return (index, key_str, f"{get_value_type(value)} ({len(value)} bytes)")
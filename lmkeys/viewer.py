@@ -1,15 +1,23 @@
 """TUI viewer for LMDB keys using Textual"""
 
 import lmdb
+import threading
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, Static
 from textual.binding import Binding
 from textual.containers import Container
 
-from .utils import format_key, format_value_info
+from .utils import make_row
+
+
+# Maximum number of formatted pages kept in memory
+PAGE_CACHE_SIZE = 32
 
 
 class LMDBViewer(App):
@@ -57,8 +65,25 @@ class LMDBViewer(App):
         self.db_path = Path(db_path)
         self.page_size = page_size
         self.current_page = 0
+        # Pre-stringified labels for the Index column of the first pages
+        self._idx_pool = [str(i) for i in range(1, page_size * 2 + 1)]
         self.env: Optional[lmdb.Environment] = None
         self.total_keys: Optional[int] = None
+        self.total_pages: Optional[int] = None
+        # Read-only session: one txn and cursor serve every page load
+        self._txn: Optional[lmdb.Transaction] = None
+        self._cursor: Optional[lmdb.Cursor] = None
+        # Widgets looked up once on mount instead of on every keypress
+        self._table: Optional[DataTable] = None
+        self._info: Optional[Static] = None
+        # LRU cache of formatted rows, keyed by page number
+        self._page_cache: "OrderedDict[int, List[Tuple[str, str, str]]]" = OrderedDict()
+        # First key of each page seen so far, used to seek with set_range
+        self._page_anchors: Dict[int, bytes] = {}
+        # Guards the page cache and anchors, shared with prefetch workers
+        self._cache_lock = threading.Lock()
+        # Held while a prefetch worker reads so the env is not closed under it
+        self._env_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -71,6 +96,9 @@ class LMDBViewer(App):
 
     def on_mount(self) -> None:
         """Set up the application after DOM is ready."""
+        self._table = self.query_one("#keys_table", DataTable)
+        self._info = self.query_one("#info", Static)
+
         # Open LMDB environment
         try:
             self.env = lmdb.open(
@@ -84,11 +112,15 @@ class LMDBViewer(App):
             return
 
         # Get total number of keys
-        with self.env.begin() as txn:
-            self.total_keys = txn.stat()['entries']
+        self.total_keys = self.env.stat()['entries']
+        self.total_pages = (self.total_keys + self.page_size - 1) // self.page_size
+
+        # buffers=True hands out zero-copy memoryviews valid for the txn
+        self._txn = self.env.begin(buffers=True)
+        self._cursor = self._txn.cursor()
 
         # Set up the data table
-        table = self.query_one("#keys_table", DataTable)
+        table = self._table
         table.add_columns("Index", "Key", "Value Type")
         table.cursor_type = "row"
 
@@ -102,64 +134,153 @@ class LMDBViewer(App):
         Args:
             page: Page number to load (0-indexed)
         """
-        if self.env is None or self.total_keys is None:
+        if self.env is None or self.total_pages is None:
             return
 
         # Calculate page bounds
-        total_pages = (self.total_keys + self.page_size - 1) // self.page_size
-        if page < 0 or page >= total_pages:
+        if page < 0 or page >= self.total_pages:
             return
 
         self.current_page = page
         start_idx = page * self.page_size
         end_idx = min(start_idx + self.page_size, self.total_keys)
 
-        # Clear existing rows
-        table = self.query_one("#keys_table", DataTable)
-        table.clear()
+        rows = self._cached_rows(page)
+        if rows is None:
+            rows = self._fetch_rows(self._cursor, page, start_idx, end_idx)
+            self._store_rows(page, rows)
 
-        # Fetch keys for this page
-        with self.env.begin() as txn:
-            cursor = txn.cursor()
-            rows = []
+        # Replace the table contents in one batch
+        self._table.clear()
+        self._table.add_rows(rows)
 
-            # Skip to the start position
-            if cursor.first():
-                for _ in range(start_idx):
-                    if not cursor.next():
-                        break
+        # Update info display
+        self._info.update(
+            f"Page {page + 1}/{self.total_pages} | "
+            f"Showing {start_idx + 1}-{end_idx} of {self.total_keys} keys | "
+            f"DB: {self.db_path.name}"
+        )
 
-                # Collect keys for this page
-                for i in range(start_idx, end_idx):
-                    key = cursor.key()
-                    value = cursor.value()
+        # Warm the cache for the pages the user is likely to open next
+        self._prefetch(page + 1)
+        self._prefetch(page - 1)
 
-                    if key is not None:
-                        key_str = format_key(key)
-                        value_info = format_value_info(value) if value is not None else "None"
-                        rows.append((str(i + 1), key_str, value_info))
+    def _cached_rows(self, page: int) -> Optional[List[Tuple[str, str, str]]]:
+        """
+        Look up a page in the cache, marking it as recently used.
 
-                    if not cursor.next():
-                        break
+        Args:
+            page: Page number to look up (0-indexed)
 
-        # Add rows to table
-        for row in rows:
-            table.add_row(*row)
+        Returns:
+            Cached rows, or None if the page has not been read yet
+        """
+        with self._cache_lock:
+            rows = self._page_cache.get(page)
+            if rows is not None:
+                self._page_cache.move_to_end(page)
+            return rows
 
-        # Update info display
-        info = self.query_one("#info", Static)
-        info.update(
-            f"Page {page + 1}/{total_pages} | "
-            f"Showing {start_idx + 1}-{end_idx} of {self.total_keys} keys | "
-            f"DB: {self.db_path.name}"
-        )
+    def _store_rows(self, page: int, rows: List[Tuple[str, str, str]]) -> None:
+        """
+        Add a page to the cache, evicting the least recently used pages.
+
+        Args:
+            page: Page number of the rows (0-indexed)
+            rows: Formatted rows of the page
+        """
+        with self._cache_lock:
+            self._page_cache[page] = rows
+            while len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+
+    @work(exclusive=False, thread=True)
+    def _prefetch(self, page: int) -> None:
+        """
+        Read and cache a page in a background thread.
+
+        Args:
+            page: Page number to prefetch (0-indexed)
+        """
+        with self._env_lock:
+            if self.env is None or self.total_pages is None:
+                return
+            if page < 0 or page >= self.total_pages:
+                return
+
+            with self._cache_lock:
+                if page in self._page_cache:
+                    return
+
+            start_idx = page * self.page_size
+            end_idx = min(start_idx + self.page_size, self.total_keys)
+            # The app's cursor belongs to the main thread, so read with our own
+            with self.env.begin(buffers=True) as txn:
+                rows = self._fetch_rows(txn.cursor(), page, start_idx, end_idx)
+
+        self._store_rows(page, rows)
+
+    def _fetch_rows(
+        self, cursor: lmdb.Cursor, page: int, start_idx: int, end_idx: int
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Read and format the rows of a page.
+
+        Args:
+            cursor: Cursor of a read transaction opened with buffers=True
+            page: Page number being read (0-indexed)
+            start_idx: Position of the first key (0-indexed)
+            end_idx: Position after the last key
+
+        Returns:
+            List of (index, key, value info) tuples
+        """
+        # Seek from the closest known anchor instead of the first key
+        with self._cache_lock:
+            anchor_page = max((p for p in self._page_anchors if p <= page), default=None)
+            anchor = self._page_anchors.get(anchor_page)
+        if anchor is None:
+            found = cursor.first()
+            skip = start_idx
+        else:
+            found = cursor.set_range(anchor)
+            skip = start_idx - anchor_page * self.page_size
+
+        if not found:
+            return []
+
+        # Skip to the start position and pull the whole page in one batch;
+        # list(islice()) drives the iterator from C without a Python-level
+        # step per key
+        count = end_idx - start_idx
+        items = list(islice(cursor.iternext(keys=True, values=True), skip, skip + count))
+        if not items:
+            return []
+
+        first_key = bytes(items[0][0])
+        with self._cache_lock:
+            self._page_anchors[page] = first_key
+
+        labels = self._idx_pool[start_idx:end_idx]
+        labels += map(str, range(start_idx + len(labels) + 1, end_idx + 1))
+        rows = [
+            make_row(label, bytes(key), value)
+            for label, (key, value) in zip(labels, items)
+        ]
+
+        # iternext leaves the cursor on the last key it yielded
+        if len(items) == count and cursor.next():
+            next_key = bytes(cursor.key())
+            with self._cache_lock:
+                self._page_anchors[page + 1] = next_key
+
+        return rows
 
     def action_next_page(self) -> None:
         """Move to the next page."""
-        if self.total_keys is None:
+        if self.total_pages is None:
             return
-        total_pages = (self.total_keys + self.page_size - 1) // self.page_size
-        if self.current_page < total_pages - 1:
+        if self.current_page < self.total_pages - 1:
             self.load_page(self.current_page + 1)
 
     def action_prev_page(self) -> None:
@@ -169,18 +290,22 @@ class LMDBViewer(App):
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the table."""
-        table = self.query_one("#keys_table", DataTable)
-        table.action_cursor_down()
+        self._table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in the table."""
-        table = self.query_one("#keys_table", DataTable)
-        table.action_cursor_up()
+        self._table.action_cursor_up()
 
     def on_unmount(self) -> None:
         """Clean up when the app is closed."""
-        if self.env is not None:
-            self.env.close()
+        with self._env_lock:
+            if self._txn is not None:
+                self._txn.abort()
+                self._txn = None
+                self._cursor = None
+            if self.env is not None:
+                self.env.close()
+                self.env = None
 
 
 def run_viewer(db_path: str, page_size: int = 30) -> None: